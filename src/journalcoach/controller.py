@@ -5,8 +5,10 @@ from tkinter import filedialog, messagebox
 from typing import Optional
 from .ui.view import MainView
 from .ui.history import HistoryDialog
+from .ui.analytics import AnalyticsDialog
 from .services.llm import LLMService
 from .storage.jsonl_store import JSONLStore, build_record
+from .storage.analytics import JournalAnalytics
 from .utils.threads import run_in_thread
 from .utils.retry import retry
 from .utils.rate_limit import TokenBucket
@@ -23,6 +25,7 @@ class Controller:
             self.on_choose_file,
             self.on_clear,
             self.on_history,
+            self.on_analytics,
         )
         self.llm = LLMService()
         self.original_entry: Optional[str] = None
@@ -34,6 +37,7 @@ class Controller:
         self.cfg_path = os.path.join(cfg_dir, "config.json")
 
         self.store = JSONLStore(self._load_path_from_config())
+        self.analytics = JournalAnalytics(self.store)
         self.bucket = TokenBucket(env.get_rate_limit_per_minute())
 
         # Prompt for path if missing
@@ -78,6 +82,16 @@ class Controller:
         except Exception as exc:
             messagebox.showerror("JournalCoach", "Could not open history: " + str(exc))
 
+    def on_analytics(self) -> None:
+        if not self.store.path:
+            self._prompt_for_path_if_missing()
+            if not self.store.path:
+                return
+        try:
+            AnalyticsDialog(self.view, self.analytics)
+        except Exception as exc:
+            messagebox.showerror("JournalCoach", "Could not open analytics: " + str(exc))
+
     def on_clear(self) -> None:
         self.view.set_input("")
         self.view.clear_output()
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import statistics
+from array import array
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from .jsonl_store import JSONLStore
+
+MISSING_DAY = 0
+SIGNATURE_BYTES = 256
+
+def _parse_ts(value) -> float:
+    try:
+        dt = datetime.fromisoformat(str(value))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    except (ValueError, OverflowError, OSError):
+        return float("nan")
+
+def _parse_day(value, ts: float) -> int:
+    try:
+        return date.fromisoformat(str(value)).toordinal()
+    except ValueError:
+        pass
+    if ts == ts:  # not NaN
+        try:
+            return datetime.fromtimestamp(ts, timezone.utc).date().toordinal()
+        except (ValueError, OverflowError, OSError):
+            pass
+    return MISSING_DAY
+
+def _week_start(day: int) -> int:
+    # Ordinal 1 (0001-01-01) is a Monday, so this gives Monday-based weeks.
+    return day - (day - 1) % 7
+
+def _streaks(days: List[int], today: int) -> Dict[str, int]:
+    """
+    Longest and current runs of consecutive days in sorted, distinct day ordinals.
+    The current streak is still alive if the last entry was yesterday.
+    """
+    if not days:
+        return {"longest": 0, "current": 0}
+    longest = run = 1
+    for prev, cur in zip(days, days[1:]):
+        run = run + 1 if cur - prev == 1 else 1
+        longest = max(longest, run)
+    current = run if today - days[-1] <= 1 else 0
+    return {"longest": longest, "current": current}
+
+def _gaps(days: List[int], top: int) -> List[Dict]:
+    """
+    Largest stretches of days without an entry, largest first.
+    """
+    found = []
+    for prev, cur in zip(days, days[1:]):
+        missed = cur - prev - 1
+        if missed > 0:
+            found.append({
+                "start": date.fromordinal(prev + 1),
+                "end": date.fromordinal(cur - 1),
+                "days": missed,
+            })
+    found.sort(key=lambda g: g["days"], reverse=True)
+    return found[:top]
+
+class JournalAnalytics:
+    """
+    Columnar cache of the journal for statistics.
+    Keeps one typed array per field plus a title string table. On refresh it
+    only reads the bytes appended since the last refresh, and rebuilds when the
+    file was replaced or rewritten underneath it.
+    """
+
+    def __init__(self, store: JSONLStore) -> None:
+        self.store = store
+        self._reset(None)
+
+    def _reset(self, path: Optional[str]) -> None:
+        self.path = path
+        self.offset = 0            # bytes of complete lines consumed
+        self._signature = b""      # last bytes before offset, to detect rewrites
+        self._ino = None
+        self._size = None
+        self._mtime_ns = None
+        self._committed = (0, 0)   # (rows, titles) backed by complete lines
+        self.ts = array("d")       # UTC epoch seconds, NaN if missing
+        self.day = array("l")      # date_local as proleptic ordinal, 0 if missing
+        self.length = array("l")   # summary length in characters
+        self.title_idx = array("l")
+        self.titles: List[str] = []
+        self._title_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+    def _is_stale(self, st: os.stat_result) -> bool:
+        if not self.offset:
+            return False
+        if st.st_ino != self._ino or st.st_size < self.offset:
+            return True
+        # Same size but touched again means it was rewritten in place, not appended to.
+        return st.st_size == self._size and st.st_mtime_ns != self._mtime_ns
+
+    def _rollback(self) -> None:
+        # Drop the unterminated last line read on the previous refresh.
+        rows, titles = self._committed
+        for col in (self.ts, self.day, self.length, self.title_idx):
+            del col[rows:]
+        for title in self.titles[titles:]:
+            del self._title_ids[title]
+        del self.titles[titles:]
+
+    def refresh(self) -> None:
+        path = self.store.path
+        if path != self.path or not path or not os.path.exists(path):
+            self._reset(path)
+            if not path or not os.path.exists(path):
+                return
+        st = os.stat(path)
+        if self._is_stale(st):
+            self._reset(path)
+        self._rollback()
+        with open(path, "rb") as f:
+            if self.offset:
+                f.seek(self.offset - len(self._signature))
+                if f.read(len(self._signature)) != self._signature:
+                    self._reset(path)
+            f.seek(self.offset)
+            chunk = f.read()
+        self._ino = st.st_ino
+        self._size = st.st_size
+        self._mtime_ns = st.st_mtime_ns
+
+        end = chunk.rfind(b"\n") + 1
+        body, tail = chunk[:end], chunk[end:]
+        for raw in body.splitlines():
+            self._add_line(raw)
+        self.offset += len(body)
+        self._signature = (self._signature + body)[-SIGNATURE_BYTES:]
+        self._committed = (len(self), len(self.titles))
+        # Like load_all, count a last line without a newline, but keep the offset
+        # before it so it is read again once the line is finished.
+        self._add_line(tail)
+
+    def _add_line(self, raw: bytes) -> None:
+        line = raw.strip()
+        if line:
+            try:
+                self._add(json.loads(line.decode("utf-8")))
+            except Exception:
+                pass
+
+    def _add(self, e: Dict) -> None:
+        # Work out every field before touching the columns so they stay aligned.
+        ts = _parse_ts(e.get("time_gmt_iso", ""))
+        day = _parse_day(e.get("date_local", ""), ts)
+        length = len(str(e.get("summary", "")))
+        title = str(e.get("title", "Untitled"))
+        idx = self._title_ids.get(title)
+        if idx is None:
+            idx = len(self.titles)
+            self.titles.append(title)
+            self._title_ids[title] = idx
+        self.ts.append(ts)
+        self.day.append(day)
+        self.length.append(length)
+        self.title_idx.append(idx)
+
+    def recent_days(self, today: Optional[date] = None, n: int = 14) -> List[Dict]:
+        """
+        Entry count and latest title for each of the last n days, newest first.
+        """
+        end = (today or date.today()).toordinal()
+        start = end - n + 1
+        counts: Counter = Counter()
+        latest: Dict[int, int] = {}
+        for i, d in enumerate(self.day):
+            if start <= d <= end:
+                counts[d] += 1
+                prev = latest.get(d)
+                # NaN compares False, so later lines win when a timestamp is missing.
+                if prev is None or not self.ts[i] < self.ts[prev]:
+                    latest[d] = i
+        return [
+            {
+                "day": date.fromordinal(d),
+                "entries": counts[d],
+                "title": self.titles[self.title_idx[latest[d]]] if d in latest else "",
+            }
+            for d in range(end, start - 1, -1)
+        ]
+
+    def entries_per_week(self) -> Dict[date, int]:
+        counts = Counter(_week_start(d) for d in self.day if d != MISSING_DAY)
+        return {date.fromordinal(w): n for w, n in sorted(counts.items())}
+
+    def length_per_week(self) -> Dict[date, float]:
+        totals: Counter = Counter()
+        counts: Counter = Counter()
+        for d, n in zip(self.day, self.length):
+            if d != MISSING_DAY:
+                w = _week_start(d)
+                totals[w] += n
+                counts[w] += 1
+        return {date.fromordinal(w): totals[w] / counts[w] for w in sorted(counts)}
+
+    def last_saved(self) -> Optional[datetime]:
+        latest = max((t for t in self.ts if t == t), default=None)
+        if latest is None:
+            return None
+        try:
+            return datetime.fromtimestamp(latest, timezone.utc)
+        except (ValueError, OverflowError, OSError):
+            return None
+
+    def summary(self, today: Optional[date] = None) -> Dict:
+        self.refresh()
+        today = today or date.today()
+        days = sorted(set(self.day) - {MISSING_DAY})
+        total = len(self)
+        out = {
+            "entries": total,
+            "distinct_days": len(days),
+            "first_day": date.fromordinal(days[0]) if days else None,
+            "last_day": date.fromordinal(days[-1]) if days else None,
+            "last_saved": self.last_saved(),
+            "missed_days": (days[-1] - days[0] + 1 - len(days)) if days else 0,
+            "avg_length": statistics.fmean(self.length) if total else 0.0,
+            "median_length": statistics.median(self.length) if total else 0,
+            "recent_days": self.recent_days(today),
+            "entries_per_week": self.entries_per_week(),
+            "length_per_week": self.length_per_week(),
+            "gaps": _gaps(days, 5),
+        }
+        out.update(_streaks(days, today.toordinal()))
+        return out
+
+def week_label(start: date) -> str:
+    return start.strftime("%Y-%m-%d") + " to " + (start + timedelta(days=6)).strftime("%Y-%m-%d")
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import Dict
+from ..storage.analytics import JournalAnalytics, week_label
+
+class AnalyticsDialog(tk.Toplevel):
+    def __init__(self, master: tk.Misc, analytics: JournalAnalytics) -> None:
+        super().__init__(master)
+        self.title("Analytics")
+        self.geometry("700x500")
+        self.minsize(500, 350)
+        self.analytics = analytics
+
+        # Layout
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
+
+        top = ttk.Frame(self)
+        top.grid(row=0, column=0, sticky="ew", padx=8, pady=6)
+        top.columnconfigure(0, weight=1)
+        self.lbl_path = ttk.Label(top, text="File: " + (self.analytics.store.path or "(not set)"))
+        self.lbl_path.grid(row=0, column=0, sticky="w")
+        self.btn_refresh = ttk.Button(top, text="Refresh", command=self._load_stats)
+        self.btn_refresh.grid(row=0, column=1, padx=4)
+
+        body = ttk.Frame(self)
+        body.grid(row=1, column=0, sticky="nsew", padx=8, pady=6)
+        body.rowconfigure(0, weight=1)
+        body.columnconfigure(0, weight=1)
+        self.txt_stats = tk.Text(body, wrap="none", state="disabled", font="TkFixedFont")
+        self.txt_stats.grid(row=0, column=0, sticky="nsew")
+        sb = ttk.Scrollbar(body, orient="vertical", command=self.txt_stats.yview)
+        sb.grid(row=0, column=1, sticky="ns")
+        self.txt_stats.configure(yscrollcommand=sb.set)
+
+        # Modal-ish behavior
+        self.transient(master)
+        self.grab_set()
+
+        # Initial load
+        self._load_stats()
+
+    def _load_stats(self) -> None:
+        try:
+            stats = self.analytics.summary()
+        except Exception as exc:
+            messagebox.showerror("Analytics", "Could not compute analytics: " + str(exc))
+            return
+        self._set_text(self._format(stats))
+
+    def _format(self, s: Dict) -> str:
+        if not s["entries"]:
+            return "No entries yet."
+        lines = []
+        lines.append("Entries: " + str(s["entries"]))
+        lines.append("Days with an entry: " + str(s["distinct_days"]))
+        if s["first_day"]:
+            lines.append("Range: " + s["first_day"].isoformat() + " to " + s["last_day"].isoformat())
+        if s["last_saved"]:
+            lines.append("Last saved (UTC): " + s["last_saved"].strftime("%Y-%m-%d %H:%M"))
+        lines.append("Days without an entry: " + str(s["missed_days"]))
+        lines.append("Current streak: " + str(s["current"]) + " days")
+        lines.append("Longest streak: " + str(s["longest"]) + " days")
+        lines.append("Summary length: avg %.0f, median %.0f chars" % (s["avg_length"], s["median_length"]))
+
+        lines.append("")
+        lines.append("Last %d days" % len(s["recent_days"]))
+        for r in s["recent_days"]:
+            lines.append("  %s  %d  %s" % (r["day"].isoformat(), r["entries"], r["title"]))
+
+        if s["gaps"]:
+            lines.append("")
+            lines.append("Longest gaps")
+            for g in s["gaps"]:
+                lines.append("  %s to %s  (%d days)" % (g["start"].isoformat(), g["end"].isoformat(), g["days"]))
+
+        per_week = s["entries_per_week"]
+        if per_week:
+            lengths = s["length_per_week"]
+            lines.append("")
+            lines.append("Per week (newest first)")
+            for start in sorted(per_week, reverse=True):
+                n = per_week[start]
+                lines.append("  %s  %d  %-7s  avg %.0f chars" % (week_label(start), n, "#" * n, lengths.get(start, 0.0)))
+        return "\n".join(lines)
+
+    def _set_text(self, value: str) -> None:
+        self.txt_stats.configure(state="normal")
+        self.txt_stats.delete("1.0", "end")
+        self.txt_stats.insert("1.0", value)
+        self.txt_stats.configure(state="disabled")
@@ -12,6 +12,7 @@ class MainView(ttk.Frame):
         on_choose_file: Callable[[], None],
         on_clear: Callable[[], None],
         on_history: Callable[[], None],
+        on_analytics: Callable[[], None],
     ) -> None:
         super().__init__(master)
         self.grid(sticky="nsew")
@@ -39,7 +40,7 @@ class MainView(ttk.Frame):
 
         btns = ttk.Frame(self)
         btns.grid(row=4, column=0, sticky="ew", padx=6, pady=6)
-        for i in range(5):
+        for i in range(6):
             btns.columnconfigure(i, weight=1)
 
         self.btn_ask = ttk.Button(btns, text="Ask Questions", command=on_ask)
@@ -54,8 +55,11 @@ class MainView(ttk.Frame):
         self.btn_history = ttk.Button(btns, text="History", command=on_history)
         self.btn_history.grid(row=0, column=3, sticky="ew", padx=4)
 
+        self.btn_analytics = ttk.Button(btns, text="Analytics", command=on_analytics)
+        self.btn_analytics.grid(row=0, column=4, sticky="ew", padx=4)
+
         self.btn_clear = ttk.Button(btns, text="Clear", command=on_clear)
-        self.btn_clear.grid(row=0, column=4, sticky="ew", padx=4)
+        self.btn_clear.grid(row=0, column=5, sticky="ew", padx=4)
 
         status_row = ttk.Frame(self)
         status_row.grid(row=5, column=0, sticky="ew", padx=6, pady=(0, 6))
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+from datetime import date
+
+import pytest
+
+from journalcoach.storage.analytics import JournalAnalytics
+from journalcoach.storage.jsonl_store import JSONLStore
+
+def record(day: str, title: str = "t", summary: str = "abc") -> dict:
+    return {
+        "date_local": day,
+        "time_gmt_iso": day + "T10:00:00+00:00",
+        "title": title,
+        "summary": summary,
+    }
+
+def write_lines(path: str, records, end: str = "\n") -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(json.dumps(r) for r in records) + end)
+
+def assert_aligned(a: JournalAnalytics) -> None:
+    assert len(a.ts) == len(a.day) == len(a.length) == len(a.title_idx) == len(a)
+    assert all(0 <= i < len(a.titles) for i in a.title_idx)
+    assert sorted(a._title_ids.values()) == list(range(len(a.titles)))
+
+@pytest.fixture
+def store(tmp_path):
+    return JSONLStore(str(tmp_path / "journal.jsonl"))
+
+def test_missing_file_is_empty(store):
+    a = JournalAnalytics(store)
+    assert a.summary()["entries"] == 0
+
+def test_incremental_append_reads_only_new_lines(store):
+    a = JournalAnalytics(store)
+    store.append_entry(record("2024-01-01"))
+    store.append_entry(record("2024-01-02"))
+    a.refresh()
+    assert len(a) == 2
+    first_offset = a.offset
+    store.append_entry(record("2024-01-03"))
+    a.refresh()
+    assert len(a) == 3
+    assert a.offset == os.path.getsize(store.path) > first_offset
+    a.refresh()
+    assert len(a) == 3
+    assert_aligned(a)
+
+def test_truncated_file_is_rebuilt(store):
+    a = JournalAnalytics(store)
+    for d in ("2024-01-01", "2024-01-02", "2024-01-03"):
+        store.append_entry(record(d))
+    a.refresh()
+    write_lines(store.path, [record("2023-05-05")])
+    a.refresh()
+    assert list(a.entries_per_week().values()) == [1]
+    assert len(a) == 1
+
+def test_rewritten_larger_file_is_rebuilt(store):
+    a = JournalAnalytics(store)
+    store.append_entry(record("2024-01-01"))
+    store.append_entry(record("2024-01-02"))
+    a.refresh()
+    days = ["2023-05-0%d" % i for i in range(1, 6)]
+    write_lines(store.path, [record(d, summary="longer summary text") for d in days])
+    s = a.summary(today=date(2023, 5, 5))
+    assert s["entries"] == 5
+    assert s["first_day"] == date(2023, 5, 1)
+    assert s["last_day"] == date(2023, 5, 5)
+
+def test_replaced_file_is_rebuilt(store, tmp_path):
+    a = JournalAnalytics(store)
+    store.append_entry(record("2024-01-01"))
+    a.refresh()
+    other = str(tmp_path / "restored.jsonl")
+    write_lines(other, [record("2024-01-01"), record("2024-01-02")])
+    os.replace(other, store.path)
+    a.refresh()
+    assert len(a) == 2
+
+def test_unterminated_last_line_counts_like_load_all(store):
+    write_lines(store.path, [record("2024-01-01")], end="")
+    a = JournalAnalytics(store)
+    assert a.summary()["entries"] == len(list(store.load_all())) == 1
+    assert a.offset == 0
+    with open(store.path, "a", encoding="utf-8") as f:
+        f.write("\n" + json.dumps(record("2024-01-02")) + "\n")
+    a.refresh()
+    assert len(a) == 2
+    assert a.offset == os.path.getsize(store.path)
+    assert_aligned(a)
+
+def test_half_written_line_is_picked_up_later(store):
+    store.append_entry(record("2024-01-01"))
+    line = json.dumps(record("2024-01-02", title="new title"))
+    with open(store.path, "a", encoding="utf-8") as f:
+        f.write(line[:10])
+    a = JournalAnalytics(store)
+    a.refresh()
+    assert len(a) == 1
+    with open(store.path, "a", encoding="utf-8") as f:
+        f.write(line[10:])
+    a.refresh()
+    assert len(a) == 2
+    with open(store.path, "a", encoding="utf-8") as f:
+        f.write("\n")
+    a.refresh()
+    assert len(a) == 2
+    assert a.titles == ["t", "new title"]
+    assert_aligned(a)
+
+def test_bad_records_keep_columns_aligned(store):
+    store.ensure_file()
+    with open(store.path, "w", encoding="utf-8") as f:
+        f.write("not json\n")
+        f.write("[1, 2]\n")
+        f.write(json.dumps({"time_gmt_iso": "9999-12-31T23:00:00-05:00", "title": "far"}) + "\n")
+        f.write(json.dumps(record("2024-01-01")) + "\n")
+    a = JournalAnalytics(store)
+    a.refresh()
+    assert len(a) == 2
+    assert a.titles == ["far", "t"]
+    assert_aligned(a)
+
+def test_streaks_today_and_yesterday(store):
+    for d in ("2024-01-01", "2024-01-02", "2024-01-03", "2024-01-05", "2024-01-06"):
+        store.append_entry(record(d))
+    a = JournalAnalytics(store)
+    assert a.summary(today=date(2024, 1, 6))["current"] == 2
+    assert a.summary(today=date(2024, 1, 7))["current"] == 2
+    s = a.summary(today=date(2024, 1, 8))
+    assert s["current"] == 0
+    assert s["longest"] == 3
+
+def test_gaps_and_missed_days(store):
+    for d in ("2024-01-01", "2024-01-03", "2024-01-10"):
+        store.append_entry(record(d))
+    s = JournalAnalytics(store).summary(today=date(2024, 1, 10))
+    assert s["missed_days"] == 7
+    assert [(g["start"], g["end"], g["days"]) for g in s["gaps"]] == [
+        (date(2024, 1, 4), date(2024, 1, 9), 6),
+        (date(2024, 1, 2), date(2024, 1, 2), 1),
+    ]
+
+def test_median_and_recent_days(store):
+    store.append_entry(record("2024-01-01", summary="a" * 10))
+    store.append_entry(record("2024-01-02", title="first", summary="a" * 20))
+    store.append_entry(record("2024-01-02", title="second", summary="a" * 30))
+    store.append_entry(record("2024-01-03", summary="a" * 40))
+    s = JournalAnalytics(store).summary(today=date(2024, 1, 3))
+    assert s["median_length"] == 25
+    recent = s["recent_days"]
+    assert len(recent) == 14
+    assert recent[0]["day"] == date(2024, 1, 3)
+    assert (recent[1]["entries"], recent[1]["title"]) == (2, "second")
+    assert recent[3]["entries"] == 0